@@ -0,0 +1,22 @@
+import multiprocessing
+
+# Gunicorn configuration for serving the blog in production:
+#
+#   gunicorn -c gunicorn.conf.py main:app
+#
+# The gevent worker class monkey-patches the stdlib before the app is
+# imported, so blocking socket I/O (database, gravatar fetches) yields to
+# other requests instead of stalling the worker.
+#
+# With more than one worker the in-process defaults for caching and rate
+# limiting are no longer coherent across processes: set
+# CACHE_TYPE=RedisCache (with CACHE_REDIS_URL) so cache invalidation on post
+# changes reaches every worker, and RATELIMIT_STORAGE_URI to a shared
+# backend so the login/register limit is enforced globally rather than per
+# worker.
+
+bind = "0.0.0.0:5002"
+worker_class = "gevent"
+workers = 2 * multiprocessing.cpu_count() + 1
+worker_connections = 1000
+keepalive = 5
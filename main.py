@@ -1,30 +1,162 @@
 from __future__ import annotations
-from datetime import date
-from flask import Flask, abort, render_template, redirect, url_for, flash, session
+from datetime import date, datetime
+from flask import (
+    Flask,
+    abort,
+    render_template,
+    redirect,
+    request,
+    url_for,
+    flash,
+    session,
+)
 from flask_bootstrap import Bootstrap5
+from flask_caching import Cache
 from flask_ckeditor import CKEditor
+from flask_limiter import Limiter
+from flask_limiter.util import get_remote_address
 from flask_login import UserMixin, login_user, LoginManager, current_user, logout_user
 from flask_sqlalchemy import SQLAlchemy
-from functools import wraps
-from werkzeug.security import generate_password_hash, check_password_hash
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
+from sqlalchemy import event
+from sqlalchemy.orm import selectinload
+from werkzeug.security import check_password_hash
 from forms import CreatePostForm, RegisterForm, LoginForm, CommentForm
-from flask_gravatar import Gravatar
+import argon2
+import hashlib
+import os
+
+try:
+    from gevent import monkey as gevent_monkey
+except ImportError:
+    gevent_monkey = None
 
 
 app = Flask(__name__)
 app.config["SECRET_KEY"] = "CreateYourOwnSecretKey"
+# CSRF tokens stay valid for the whole session; skips the per-request
+# token-expiry bookkeeping WTForms does when a time limit is set.
+app.config["WTF_CSRF_TIME_LIMIT"] = None
+
+# Number of blog posts shown per page on the index.
+PAGE_SIZE = 10
+
+# Argon2id hasher for passwords. Legacy PBKDF2 hashes (werkzeug) are still
+# verified on login and transparently rehashed with Argon2.
+ph = argon2.PasswordHasher(time_cost=2, memory_cost=64 * 1024, parallelism=2)
+
+# Verified against when a login names an unknown email, so both branches
+# spend the same KDF time and response timing does not leak which emails
+# have accounts.
+DUMMY_ARGON2_HASH = ph.hash("dummy")
+
+# Argon2 is CPU-bound C code that releases the GIL but never yields to
+# gevent's event loop. Under the gevent worker the stdlib executor's threads
+# are themselves greenlets and would still pin the loop for the whole KDF, so
+# run_kdf dispatches to gevent's native hub threadpool in that case; the
+# plain executor covers unpatched processes.
+HASH_EXECUTOR = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+
+def run_kdf(func, *args):
+    """
+    Run an Argon2 operation on a native thread.
+    Args:
+        func (callable): The Argon2 operation (ph.hash or ph.verify).
+        *args: Arguments for the operation.
+    Returns:
+        The operation's return value; its exceptions propagate unchanged.
+    """
+    if gevent_monkey is not None and gevent_monkey.is_module_patched("threading"):
+        from gevent import get_hub
+
+        return get_hub().threadpool.apply(func, args)
+    return HASH_EXECUTOR.submit(func, *args).result()
+
+
+def hash_password(password):
+    """
+    Hash a password on a native thread.
+    Args:
+        password (str): The plaintext password to hash.
+    Returns:
+        str: The Argon2id hash of the password.
+    """
+    return run_kdf(ph.hash, password)
+
+
+def run_verify(stored_hash, password):
+    """
+    Run an Argon2 verification on a native thread.
+    Args:
+        stored_hash (str): The stored Argon2 hash to verify against.
+        password (str): The plaintext password from the login form.
+    Raises:
+        argon2.exceptions.VerifyMismatchError: If the password does not match.
+    """
+    run_kdf(ph.verify, stored_hash, password)
+
+
 ckeditor = CKEditor(app)
 Bootstrap5(app)
 
+# Response cache for anonymous traffic. The SimpleCache default is
+# per-process and only coherent with a single worker; multi-worker
+# deployments (see gunicorn.conf.py) must set CACHE_TYPE=RedisCache so that
+# post create/edit/delete invalidation reaches every worker.
+cache = Cache(
+    app,
+    config={
+        "CACHE_TYPE": os.environ.get("CACHE_TYPE", "SimpleCache"),
+        "CACHE_REDIS_URL": os.environ.get(
+            "CACHE_REDIS_URL", "redis://localhost:6379/0"
+        ),
+        "CACHE_DEFAULT_TIMEOUT": 300,
+    },
+)
+
 login_manager = LoginManager()
 login_manager.init_app(app)
 
+# Rate limiting for the credential endpoints; bounds brute-force attempts
+# and the KDF work they can force the server to do. The in-memory default
+# counts per process, so multi-worker deployments must point
+# RATELIMIT_STORAGE_URI at a shared backend (e.g. redis://) for the limit
+# to hold globally.
+limiter = Limiter(
+    get_remote_address,
+    app=app,
+    storage_uri=os.environ.get("RATELIMIT_STORAGE_URI", "memory://"),
+)
+
 
 # CONNECT TO DB
-app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///posts.db"
+# Production points DATABASE_URL at Postgres (postgresql+psycopg://...), whose
+# pool is sized so concurrent gevent greenlets do not starve waiting for a
+# connection. Local development falls back to the bundled SQLite file.
+app.config["SQLALCHEMY_DATABASE_URI"] = os.environ.get(
+    "DATABASE_URL", "sqlite:///posts.db"
+)
+if app.config["SQLALCHEMY_DATABASE_URI"].startswith("sqlite"):
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {"pool_pre_ping": True}
+else:
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+        "pool_size": 20,
+        "max_overflow": 10,
+        "pool_pre_ping": True,
+        "pool_recycle": 300,
+    }
 db = SQLAlchemy()
 db.init_app(app)
 
+# Relationships the templates read use lazy="raise" in development, so a view
+# that forgets to eager-load them fails loudly instead of silently issuing
+# N+1 queries.
+TEMPLATE_RELATIONSHIP_LAZY = (
+    "raise" if os.environ.get("FLASK_ENV") == "development" else "select"
+)
+
 
 # CONFIGURE TABLES
 class BlogPost(db.Model):
@@ -35,7 +167,7 @@ class BlogPost(db.Model):
         author_id (Integer): Foreign key, linking to the author's user ID.
         title (String): Title of the blog post, unique and non-nullable.
         subtitle (String): Subtitle of the blog post, non-nullable.
-        date (String): Publication date of the blog post, non-nullable.
+        date (Date): Publication date of the blog post, non-nullable.
         body (Text): Content of the blog post, non-nullable.
         img_url (String): URL of the blog post's feature image, non-nullable.
         comments (relationship): Link to comments associated with the blog post.
@@ -44,14 +176,22 @@ class BlogPost(db.Model):
     __tablename__ = "blog_posts"
     id = db.Column(db.Integer, primary_key=True)
     author_id = db.Column(db.Integer, db.ForeignKey("users.id"))
-    author = db.relationship("User", back_populates="posts")
+    author = db.relationship(
+        "User", back_populates="posts", lazy=TEMPLATE_RELATIONSHIP_LAZY
+    )
     title = db.Column(db.String(250), unique=True, nullable=False)
     subtitle = db.Column(db.String(250), nullable=False)
-    date = db.Column(db.String(250), nullable=False)
+    date = db.Column(db.Date, nullable=False, index=True)
     body = db.Column(db.Text, nullable=False)
     img_url = db.Column(db.String(250), nullable=False)
 
-    comments = db.relationship("Comment", back_populates="parent_post")
+    comments = db.relationship(
+        "Comment",
+        back_populates="parent_post",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy=TEMPLATE_RELATIONSHIP_LAZY,
+    )
 
 
 class User(UserMixin, db.Model):
@@ -62,15 +202,19 @@ class User(UserMixin, db.Model):
         email (String): Email address of the user, unique and non-nullable.
         password (String): Hashed password for user account security, non-nullable.
         name (String): Name of the user, non-nullable.
+        is_admin (Boolean): Whether the user may manage blog posts, non-nullable.
+        gravatar_url (String): Precomputed Gravatar avatar URL for the user.
         posts (relationship): Link to blog posts authored by the user.
         comments (relationship): Link to comments made by the user.
     """
 
     __tablename__ = "users"
     id = db.Column(db.Integer, primary_key=True)
-    email = db.Column(db.String(500), unique=True, nullable=False)
+    email = db.Column(db.String(254), unique=True, nullable=False, index=True)
     password = db.Column(db.String(500), nullable=False)
-    name = db.Column(db.String(500), nullable=False)
+    name = db.Column(db.String(100), nullable=False)
+    is_admin = db.Column(db.Boolean, default=False, nullable=False, index=True)
+    gravatar_url = db.Column(db.String(200))
     posts = db.relationship("BlogPost", back_populates="author")
     comments = db.relationship("Comment", back_populates="comment_author")
 
@@ -91,30 +235,175 @@ class Comment(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     text = db.Column(db.Text, nullable=False)
     author_id = db.Column(db.Integer, db.ForeignKey("users.id"))
-    comment_author = db.relationship("User", back_populates="comments")
-    post_id = db.Column(db.Integer, db.ForeignKey("blog_posts.id"))
+    comment_author = db.relationship("User", back_populates="comments", lazy="joined")
+    post_id = db.Column(
+        db.Integer, db.ForeignKey("blog_posts.id", ondelete="CASCADE"), index=True
+    )
     parent_post = db.relationship("BlogPost", back_populates="comments")
 
 
-# Adding profile avatars for the comments section
-gravatar = Gravatar(
-    app,
-    size=100,
-    rating="g",
-    default="retro",
-    force_default=False,
-    force_lower=False,
-    use_ssl=False,
-    base_url=None,
-)
+# Case-insensitive unique index so email lookups in register/login are
+# index-served regardless of how the address was capitalized.
+db.Index("ix_users_email_lower", db.func.lower(User.email), unique=True)
+
+
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    Apply performance PRAGMAs to every new SQLite connection.
+    WAL journaling lets readers proceed while a write is in flight and cuts
+    fsyncs per commit; the remaining PRAGMAs size the page cache, keep temp
+    structures in memory and memory-map the database file.
+    Args:
+        dbapi_connection: The raw DB-API connection being opened.
+        connection_record: SQLAlchemy's pool bookkeeping record (unused).
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA cache_size=-64000")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
+
+
+def build_gravatar_url(email):
+    """
+    Build the Gravatar avatar URL for an email address.
+    The URL is computed once per user at registration and stored on the row,
+    so templates never hash emails while rendering comments.
+    Args:
+        email (str): The user's email address.
+    Returns:
+        str: The Gravatar URL for the email's avatar image.
+    """
+    digest = hashlib.md5(email.strip().lower().encode()).hexdigest()
+    return f"https://www.gravatar.com/avatar/{digest}?s=100&d=retro&r=g"
+
+
+def migrate_sqlite_schema():
+    """
+    Bring a pre-existing SQLite database up to the current schema.
+    db.create_all only creates missing tables, never alters existing ones, so
+    columns, indexes and the comment-cascade foreign key added since a
+    database was first created are applied here before the startup backfills
+    query them.
+    """
+    user_columns = {
+        row[1] for row in db.session.execute(db.text("PRAGMA table_info(users)"))
+    }
+    if "is_admin" not in user_columns:
+        db.session.execute(
+            db.text("ALTER TABLE users ADD COLUMN is_admin BOOLEAN NOT NULL DEFAULT 0")
+        )
+        # The admin used to be whichever account had id 1.
+        db.session.execute(db.text("UPDATE users SET is_admin = 1 WHERE id = 1"))
+    if "gravatar_url" not in user_columns:
+        db.session.execute(
+            db.text("ALTER TABLE users ADD COLUMN gravatar_url VARCHAR(200)")
+        )
+    comments_sql = db.session.execute(
+        db.text("SELECT sql FROM sqlite_master WHERE type='table' AND name='comments'")
+    ).scalar()
+    if comments_sql and "ON DELETE CASCADE" not in comments_sql:
+        db.session.execute(db.text("ALTER TABLE comments RENAME TO comments_legacy"))
+        db.session.execute(
+            db.text(
+                "CREATE TABLE comments ("
+                "id INTEGER NOT NULL, "
+                "text TEXT NOT NULL, "
+                "author_id INTEGER, "
+                "post_id INTEGER, "
+                "PRIMARY KEY (id), "
+                "FOREIGN KEY(author_id) REFERENCES users (id), "
+                "FOREIGN KEY(post_id) REFERENCES blog_posts (id) ON DELETE CASCADE)"
+            )
+        )
+        db.session.execute(
+            db.text(
+                "INSERT INTO comments (id, text, author_id, post_id) "
+                "SELECT id, text, author_id, post_id FROM comments_legacy"
+            )
+        )
+        db.session.execute(db.text("DROP TABLE comments_legacy"))
+    for index_sql in (
+        "CREATE INDEX IF NOT EXISTS ix_users_email ON users (email)",
+        "CREATE UNIQUE INDEX IF NOT EXISTS ix_users_email_lower ON users (lower(email))",
+        "CREATE INDEX IF NOT EXISTS ix_users_is_admin ON users (is_admin)",
+        "CREATE INDEX IF NOT EXISTS ix_blog_posts_date ON blog_posts (date)",
+        "CREATE INDEX IF NOT EXISTS ix_comments_post_id ON comments (post_id)",
+    ):
+        db.session.execute(db.text(index_sql))
+    db.session.commit()
+
 
 with app.app_context():
+    if db.engine.dialect.name == "sqlite":
+        event.listen(db.engine, "connect", set_sqlite_pragmas)
     db.create_all()
+    if db.engine.dialect.name == "sqlite":
+        migrate_sqlite_schema()
+    # One-shot conversion of legacy "Month DD, YYYY" date strings to the ISO
+    # format the Date column stores.
+    legacy_dates = db.session.execute(db.text("SELECT id, date FROM blog_posts")).all()
+    for legacy_id, raw_date in legacy_dates:
+        try:
+            parsed = datetime.strptime(raw_date, "%B %d, %Y").date()
+        except (TypeError, ValueError):
+            continue
+        db.session.execute(
+            db.text("UPDATE blog_posts SET date = :date WHERE id = :id"),
+            {"date": parsed.isoformat(), "id": legacy_id},
+        )
+    db.session.commit()
+    # Backfill avatar URLs for accounts created before the column existed.
+    legacy_users = (
+        db.session.execute(db.select(User).where(User.gravatar_url.is_(None)))
+        .scalars()
+        .all()
+    )
+    if legacy_users:
+        for user in legacy_users:
+            user.gravatar_url = build_gravatar_url(user.email)
+        db.session.commit()
+
+
+def verify_password(user, password):
+    """
+    Verify a user's password and migrate legacy hashes.
+    Checks the given plaintext password against the stored hash. Users whose
+    hash predates the Argon2 switch (werkzeug PBKDF2) are verified with the
+    old scheme and rehashed with Argon2 on success, as are Argon2 hashes whose
+    parameters have since been strengthened.
+    Args:
+        user (User): The user whose password is being checked.
+        password (str): The plaintext password from the login form.
+    Returns:
+        bool: True if the password matches, otherwise False.
+    """
+    if user.password.startswith("pbkdf2:"):
+        if not check_password_hash(user.password, password):
+            return False
+        user.password = hash_password(password)
+        db.session.commit()
+        cache.delete_memoized(fetch_user, str(user.id))
+        return True
+    try:
+        run_verify(user.password, password)
+    except argon2.exceptions.VerifyMismatchError:
+        return False
+    if ph.check_needs_rehash(user.password):
+        user.password = hash_password(password)
+        db.session.commit()
+        cache.delete_memoized(fetch_user, str(user.id))
+    return True
 
 
 def admin_only(function):
     """
-    Decorator to restrict access to certain views to only the admin user.
+    Decorator to restrict access to certain views to only admin users.
+    The admin flag cached in the session at login time is checked first, so
+    most admin-gated requests never have to load the user from the database.
     Args:
         function (function): A Flask view function that requires admin access.
     Returns:
@@ -124,27 +413,76 @@ def admin_only(function):
 
     @wraps(function)
     def decorated_function(*args, **kwargs):
-        if current_user.id == 1:
+        is_admin = session.get("is_admin")
+        if is_admin is None:
+            is_admin = current_user.is_authenticated and current_user.is_admin
+        if is_admin:
             return function(*args, **kwargs)
         return abort(403)
 
     return decorated_function
 
 
+@cache.memoize(timeout=60)
+def fetch_user(user_id):
+    """
+    Fetch a user by ID, memoized for 60 seconds.
+    Flask-Login calls the user loader on every authenticated request; the
+    memoization turns those repeated identical SELECTs into cache hits.
+    Entries are invalidated on logout and whenever a user row is rewritten.
+    Args:
+        user_id (str): Unique identifier for the user.
+    Returns:
+        User: A user object if found, otherwise None.
+    """
+    return db.session.execute(db.select(User).where(User.id == user_id)).scalar()
+
+
+@lru_cache(maxsize=1)
+def build_static_urls():
+    """
+    Build the URLs for the static assets the base templates reference.
+    Computed once per process so templates do not walk Flask's URL map for
+    the same filenames on every render.
+    Returns:
+        dict: Asset name mapped to its static URL.
+    """
+    return {
+        "favicon": url_for("static", filename="assets/favicon.ico"),
+        "css": url_for("static", filename="css/styles.css"),
+        "scripts_js": url_for("static", filename="js/scripts.js"),
+    }
+
+
+@app.context_processor
+def inject_static_urls():
+    """
+    Make the precomputed static asset URLs available to every template.
+    Returns:
+        dict: Context with the 'static_urls' mapping.
+    """
+    return {"static_urls": build_static_urls()}
+
+
 @login_manager.user_loader
 def load_user(user_id):
     """
     User loader callback for Flask-Login.
-    Retrieves a user from the database using the provided user ID.
+    Retrieves the (possibly cached) user and attaches it to the current
+    session without a database round trip.
     Args:
-        user_id (int): Unique identifier for the user.
+        user_id (str): Unique identifier for the user.
     Returns:
         User: A user object if found, otherwise None.
     """
-    return db.session.execute(db.select(User).where(User.id == user_id)).scalar()
+    user = fetch_user(user_id)
+    if user is not None:
+        user = db.session.merge(user, load=False)
+    return user
 
 
 @app.route("/register", methods=["GET", "POST"])
+@limiter.limit("5 per minute")
 def register():
     """
     Route for handling the registration of new users.
@@ -159,32 +497,45 @@ def register():
     register_form = RegisterForm()
     if register_form.validate_on_submit():
         email = register_form.email.data
-        password = generate_password_hash(
-            register_form.password.data, method="pbkdf2:sha256", salt_length=8
-        )
-        name = register_form.password.data
 
-        user = db.session.execute(db.Select(User).where(User.email == email)).scalar()
+        # Check for an existing account before paying for the password hash,
+        # so duplicate-email attempts cannot burn KDF time for nothing.
+        existing_user = db.session.execute(
+            db.select(User.id).where(db.func.lower(User.email) == email.lower())
+        ).scalar()
 
-        if user:
+        if existing_user:
             flash(
                 "There is an existing user with this email! Try to login with your credentials",
                 "danger",
             )
             return redirect("login")
         else:
-            new_user = User(email=email, password=password, name=name)
+            password = hash_password(register_form.password.data)
+            name = register_form.name.data
+            # The very first account keeps the admin rights that used to be
+            # tied to user id 1.
+            is_first_user = (
+                db.session.execute(db.select(db.func.count(User.id))).scalar() == 0
+            )
+            new_user = User(
+                email=email,
+                password=password,
+                name=name,
+                is_admin=is_first_user,
+                gravatar_url=build_gravatar_url(email),
+            )
             db.session.add(new_user)
             db.session.commit()
             login_user(new_user)
-            return redirect(url_for("get_all_posts", current_user=current_user))
+            session["is_admin"] = new_user.is_admin
+            return redirect(url_for("get_all_posts"))
 
-    return render_template(
-        "register.html", form=register_form, current_user=current_user
-    )
+    return render_template("register.html", form=register_form)
 
 
 @app.route("/login", methods=["GET", "POST"])
+@limiter.limit("5 per minute")
 def login():
     """
     Route for handling user login.
@@ -198,17 +549,27 @@ def login():
     if login_form.validate_on_submit():
         password = login_form.password.data
         user = db.session.execute(
-            db.Select(User).where(User.email == login_form.email.data)
+            db.select(User).where(
+                db.func.lower(User.email) == login_form.email.data.lower()
+            )
         ).scalar()
 
         # Try to give the least amount of information for XSS attacks
         if user:
-            if check_password_hash(user.password, password):
+            if verify_password(user, password):
                 login_user(user)
+                session["is_admin"] = user.is_admin
                 flash(f"User: {user.name} Logged in Successfully", "success")
                 return redirect(url_for("get_all_posts"))
+        else:
+            # Burn the same KDF time as a real verification so an unknown
+            # email cannot be told apart from a wrong password by timing.
+            try:
+                run_verify(DUMMY_ARGON2_HASH, password)
+            except argon2.exceptions.VerifyMismatchError:
+                pass
         flash("Please try again! Wrong credentials", "danger")
-    return render_template("login.html", form=login_form, current_user=current_user)
+    return render_template("login.html", form=login_form)
 
 
 @app.route("/logout")
@@ -219,34 +580,83 @@ def logout():
     Returns:
         redirect: Redirects to the 'get_all_posts' page.
     """
+    if current_user.is_authenticated:
+        cache.delete_memoized(fetch_user, current_user.get_id())
     logout_user()
     session.clear()  # Clear session data
     return redirect(url_for("get_all_posts"))
 
 
 @app.route("/")
+@cache.cached(
+    timeout=300,
+    unless=lambda: current_user.is_authenticated,
+    make_cache_key=lambda: f"posts:{request.args.get('page', 1, type=int)}",
+)
 def get_all_posts():
     """
     Route for displaying all blog posts.
-    Fetches all posts from the database and renders them on the index page.
+    Fetches one page of posts (newest first) as plain rows holding only the
+    columns the index page renders, so post bodies are never pulled into
+    memory. Author names are resolved in a single follow-up query.
     Returns:
-        render_template: Renders the 'index.html' template with all blog posts.
+        render_template: Renders the 'index.html' template with one page of blog posts.
     """
-    result = db.session.execute(db.select(BlogPost))
-    posts = result.scalars().all()
-    return render_template("index.html", all_posts=posts, current_user=current_user)
+    page = request.args.get("page", 1, type=int)
+    if page < 1:
+        page = 1
+    rows = db.session.execute(
+        db.select(
+            BlogPost.id,
+            BlogPost.title,
+            BlogPost.subtitle,
+            BlogPost.date,
+            BlogPost.img_url,
+            BlogPost.author_id,
+        )
+        .order_by(BlogPost.date.desc(), BlogPost.id.desc())
+        .limit(PAGE_SIZE + 1)
+        .offset((page - 1) * PAGE_SIZE)
+    ).all()
+    has_next = len(rows) > PAGE_SIZE
+    posts = rows[:PAGE_SIZE]
+    author_names = dict(
+        db.session.execute(
+            db.select(User.id, User.name).where(
+                User.id.in_({post.author_id for post in posts})
+            )
+        ).all()
+    )
+    return render_template(
+        "index.html",
+        all_posts=posts,
+        author_names=author_names,
+        page=page,
+        has_next=has_next,
+    )
 
 
 @app.route("/post/<int:post_id>", methods=["GET", "POST"])
 def show_post(post_id):
     """
     Route for displaying a specific blog post and its comments.
+    Comments and their authors are eagerly loaded so the page renders in a
+    fixed number of queries no matter how many comments a post has.
     Args:
         post_id (int): The unique identifier of the blog post.
     Returns:
         render_template: Renders the 'post.html' template for the specified blog post.
     """
-    requested_post = db.get_or_404(BlogPost, post_id)
+    requested_post = db.session.execute(
+        db.select(BlogPost)
+        .options(
+            selectinload(BlogPost.author),
+            selectinload(BlogPost.comments).selectinload(Comment.comment_author),
+        )
+        .where(BlogPost.id == post_id)
+    ).scalar_one_or_none()
+    if requested_post is None:
+        return abort(404)
     comment_form = CommentForm()
 
     if comment_form.validate_on_submit():
@@ -261,11 +671,15 @@ def show_post(post_id):
         )
         db.session.add(new_comment)
         db.session.commit()
+        # Post/Redirect/Get: the commit expires the eager-loaded post, so
+        # rendering here would lazy-load comments again (and raise in
+        # development); the redirect re-fetches them eagerly and also stops
+        # refresh from re-submitting the form.
+        return redirect(url_for("show_post", post_id=post_id))
 
     return render_template(
         "post.html",
         post=requested_post,
-        current_user=current_user,
         form=comment_form,
         all_comments=requested_post.comments,
     )
@@ -290,12 +704,13 @@ def add_new_post():
             body=form.body.data,
             img_url=form.img_url.data,
             author=current_user,
-            date=date.today().strftime("%B %d, %Y"),
+            date=date.today(),
         )
         db.session.add(new_post)
         db.session.commit()
+        cache.clear()  # Drop cached index pages that no longer match
         return redirect(url_for("get_all_posts"))
-    return render_template("make-post.html", form=form, current_user=current_user)
+    return render_template("make-post.html", form=form)
 
 
 @app.route("/edit-post/<int:post_id>", methods=["GET", "POST"])
@@ -311,14 +726,14 @@ def edit_post(post_id):
         render_template/redirect: Renders the 'make-post.html' template with the edit form if GET method is used,
                                   or redirects to the specific 'show_post' page if the form submission is successful.
     """
-    post = db.get_or_404(BlogPost, post_id)
-    edit_form = CreatePostForm(
-        title=post.title,
-        subtitle=post.subtitle,
-        img_url=post.img_url,
-        author=post.author,
-        body=post.body,
-    )
+    post = db.session.execute(
+        db.select(BlogPost)
+        .options(selectinload(BlogPost.author))
+        .where(BlogPost.id == post_id)
+    ).scalar_one_or_none()
+    if post is None:
+        return abort(404)
+    edit_form = CreatePostForm(obj=post)
     if edit_form.validate_on_submit():
         post.title = edit_form.title.data
         post.subtitle = edit_form.subtitle.data
@@ -326,9 +741,10 @@ def edit_post(post_id):
         post.author = current_user
         post.body = edit_form.body.data
         db.session.commit()
+        cache.clear()  # Drop cached index pages that no longer match
         return redirect(url_for("show_post", post_id=post.id))
     return render_template(
-        "make-post.html", form=edit_form, is_edit=True, current_user=current_user
+        "make-post.html", form=edit_form, is_edit=True
     )
 
 
@@ -340,25 +756,36 @@ def delete_post(post_id):
     This view is protected by the 'admin_only' decorator.
     Args:
         post_id (int): The unique identifier of the blog post to be deleted.
-    Processes the deletion of the specified post.
+    Deletes the post with a single DELETE statement; the database cascades
+    to its comments, so nothing is loaded into Python first.
     Returns:
         redirect: Redirects to the 'get_all_posts' page after the post has been deleted.
     """
-    post_to_delete = db.get_or_404(BlogPost, post_id)
-    db.session.delete(post_to_delete)
+    result = db.session.execute(db.delete(BlogPost).where(BlogPost.id == post_id))
+    if result.rowcount == 0:
+        return abort(404)
     db.session.commit()
+    cache.clear()  # Drop cached index pages that no longer match
     return redirect(url_for("get_all_posts"))
 
 
 @app.route("/about")
+@cache.cached(
+    timeout=86400, key_prefix=lambda: f"about:{current_user.is_authenticated}"
+)
 def about():
-    return render_template("about.html", current_user=current_user)
+    return render_template("about.html")
 
 
 @app.route("/contact")
+@cache.cached(
+    timeout=86400, key_prefix=lambda: f"contact:{current_user.is_authenticated}"
+)
 def contact():
-    return render_template("contact.html", current_user=current_user)
+    return render_template("contact.html")
 
 
 if __name__ == "__main__":
+    # Local development only; production runs under gunicorn (see
+    # gunicorn.conf.py).
     app.run(debug=True, port=5002)
\ No newline at end of file